@@ -10,8 +10,17 @@ Instructions:
 """
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-import PyPDF2
+import hashlib
+import queue
+import random
+import threading
+import time
+from itertools import takewhile
+from concurrent.futures import ThreadPoolExecutor
+import pypdfium2 as pdfium
 
 # ----------------------------
 # Configuration and Constants
@@ -30,173 +39,426 @@ YOUR_SITE_NAME = "YourSiteName"
 GEMINI_MODEL = "google/gemini-2.0-flash-thinking-exp:free"
 QWEN_MODEL = "qwen/qwen-vl-plus:free"
 
+# Upper bound on cached model responses kept in memory.
+RESPONSE_CACHE_MAX_ENTRIES = 512
+
+# Prompt size limits for question generation (roughly 4 characters per token).
+MAX_RESUME_PROMPT_CHARS = 8000
+RECENT_HISTORY_ROUNDS = 2
+HISTORY_SYNOPSIS_CHARS = 150
+
+# Prompt templates, filled in with str.format at call time.
+EVALUATION_PROMPT = (
+    "Evaluate the candidate's answer to the interview question with a focus on practical skills, project experience, "
+    "and clarity of the core concepts. Consider that the candidate may describe hands-on experiences differently.\n\n"
+    "Question: {question}\n\n"
+    "Answer: {answer}\n\n"
+    "Please provide two scores out of 100:\n"
+    "1. Practical Skills and Project Experience: How well does the candidate demonstrate hands-on abilities?\n"
+    "2. Clarity and Depth of Concept Explanation: How clearly and thoroughly does the candidate explain the concepts?\n\n"
+    "Briefly mention any areas for improvement."
+)
+CLARIFICATION_PROMPT = (
+    "You are a seasoned interviewer helping a candidate practice for a real interview. "
+    "The candidate has just provided an answer to the following interview question. "
+    "Please provide a detailed and correct answer that covers all key points, includes clear explanations, "
+    "and offers additional context that would be expected in a high-quality response. "
+    "In your response, highlight any areas where the candidate's answer might be lacking and show how it can be improved.\n\n"
+    "Question: {question}\n\n"
+    "Candidate's Answer: {answer}\n\n"
+    "Detailed Correct Answer and Explanation:"
+)
+QUESTION_SYSTEM_PROMPT = (
+    "You are an interviewer. Given the candidate's resume and the conversation so far, "
+    "please generate a dynamic, context-specific interview question that probes the candidate's hands-on skills "
+    "and understanding of key concepts mentioned in the resume. Avoid generic questions and ensure the question "
+    "is relevant to the candidate's background.\n\n"
+    "Candidate's Resume:\n{resume}"
+)
+QUESTION_PROMPT = (
+    "Conversation History:\n{history}\n\n"
+    "Interview Question:"
+)
+
 # ----------------------------
 # Helper Functions
 # ----------------------------
-def evaluate_with_model(model_name, answer, question):
+@st.cache_resource(show_spinner=False)
+def get_background_executor():
     """
-    Sends a prompt to the specified model to evaluate the candidate's answer.
+    Returns a thread pool shared across reruns for background LLM calls,
+    such as prefetching the next interview question.
+    """
+    return ThreadPoolExecutor(max_workers=4)
+
+@st.cache_resource(show_spinner=False)
+def get_pdfium_lock():
+    """
+    Returns a process-wide lock serialising all PDFium calls. PDFium is not thread-safe,
+    even across different documents, and each Streamlit session runs in its own thread.
+    """
+    return threading.Lock()
+
+class BackoffRetry(Retry):
+    """
+    urllib3 Retry that backs off from the first retry (backoff_factor, then doubling, plus
+    up to backoff_jitter seconds of jitter) and caps Retry-After waits at backoff_max.
+    Stock Retry retries the first failure immediately and sleeps for any Retry-After value.
+    """
+    def get_backoff_time(self):
+        consecutive_errors = len(list(
+            takewhile(lambda x: x.redirect_location is None, reversed(self.history))
+        ))
+        if consecutive_errors == 0:
+            return 0
+        backoff = self.backoff_factor * (2 ** (consecutive_errors - 1)) + random.random() * self.backoff_jitter
+        return min(self.backoff_max, backoff)
+
+    def sleep_for_retry(self, response):
+        retry_after = self.get_retry_after(response)
+        if retry_after:
+            time.sleep(min(retry_after, self.backoff_max))
+            return True
+        return False
+
+@st.cache_resource(show_spinner=False)
+def get_http_session(api_key):
     """
-    prompt = (
-        f"Evaluate the candidate's answer to the interview question with a focus on practical skills, project experience, "
-        f"and clarity of the core concepts. Consider that the candidate may describe hands-on experiences differently.\n\n"
-        f"Question: {question}\n\n"
-        f"Answer: {answer}\n\n"
-        f"Please provide two scores out of 100:\n"
-        f"1. Practical Skills and Project Experience: How well does the candidate demonstrate hands-on abilities?\n"
-        f"2. Clarity and Depth of Concept Explanation: How clearly and thoroughly does the candidate explain the concepts?\n\n"
-        f"Briefly mention any areas for improvement."
+    Returns a requests session configured for OpenRouter (auth and attribution headers),
+    shared across reruns and keyed on the API key, so connections are kept alive and
+    reused instead of paying a new TCP/TLS handshake on every call.
+    Transient failures (rate limits, 5xx, dropped connections) are retried up to twice,
+    waiting about 1s and then 2s plus jitter (Retry-After is honoured up to 16s), before
+    the error reaches the caller.
+    """
+    retry = BackoffRetry(
+        total=2,
+        backoff_factor=1,
+        backoff_jitter=1,
+        backoff_max=16,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=None,
+        raise_on_status=False
     )
-    
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    session.headers.update({
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "HTTP-Referer": YOUR_SITE_URL,
+        "X-Title": YOUR_SITE_NAME
+    })
+    return session
+
+@st.cache_resource(show_spinner=False)
+def get_response_cache():
+    """
+    Returns a process-wide cache of model responses, shared across sessions,
+    keyed on a hash of the model name and prompt.
+    """
+    return {}
+
+@st.cache_resource(show_spinner=False)
+def get_response_cache_lock():
+    """
+    Returns the lock guarding the response cache, which is read and written from
+    every session's script thread and from the background worker threads.
+    """
+    return threading.Lock()
+
+def request_completion(model_name, prompt, on_update=None, system_prompt=None, use_cache=True):
+    """
+    Sends the prompt to the specified model via OpenRouter and returns the response content
+    (None if the model returned none). Identical prompts are answered from the response cache
+    unless use_cache is False, in which case a fresh response is fetched and replaces the cached one.
+    If on_update is given, the response is streamed and on_update is called with the text
+    received so far after every chunk. A system_prompt is sent as a separate, cacheable
+    leading message so providers with prompt caching can reuse it across calls.
+    Raises on request failures so callers can report them.
+    """
+    cache = get_response_cache()
+    cache_lock = get_response_cache_lock()
+    cache_key = hashlib.sha256(
+        json.dumps([model_name, system_prompt, prompt]).encode("utf-8")
+    ).hexdigest()
+    with cache_lock:
+        cached = cache.get(cache_key) if use_cache else None
+    if cached is not None:
+        if on_update is not None:
+            on_update(cached)
+        return cached
+
     payload = {
         "model": model_name,
         "messages": [
             {"role": "user", "content": [{"type": "text", "text": prompt}]}
         ]
     }
-    headers = {
-        "Authorization": f"Bearer {API_KEY}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": YOUR_SITE_URL,
-        "X-Title": YOUR_SITE_NAME
-    }
+    if system_prompt is not None:
+        payload["messages"].insert(0, {
+            "role": "system",
+            "content": [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+        })
+    if on_update is not None:
+        payload["stream"] = True
+    response = get_http_session(API_KEY).post(
+        "https://openrouter.ai/api/v1/chat/completions",
+        data=json.dumps(payload),
+        timeout=10,
+        stream=on_update is not None
+    )
+    response.raise_for_status()
+    if on_update is None:
+        result = response.json()
+        content = result.get("choices", [{}])[0].get("message", {}).get("content")
+    else:
+        content = ""
+        with response:
+            for line in response.iter_lines():
+                # Skip blank event separators and ": OPENROUTER PROCESSING" keep-alive comments.
+                if not line.startswith(b"data: "):
+                    continue
+                data = line[len(b"data: "):].decode("utf-8")
+                if data == "[DONE]":
+                    break
+                chunk = json.loads(data)
+                if "error" in chunk:
+                    raise RuntimeError(chunk["error"].get("message", chunk["error"]))
+                # The final usage chunk carries an empty choices list.
+                delta = (chunk.get("choices") or [{}])[0].get("delta", {}).get("content")
+                if delta:
+                    content += delta
+                    on_update(content)
+        content = content or None
+
+    if content:
+        with cache_lock:
+            if len(cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+                cache.pop(next(iter(cache)))
+            cache[cache_key] = content
+    return content
+
+def _stream_to(placeholder):
+    """
+    Returns an on_update callback that renders streamed text into the placeholder, or None.
+    """
+    return placeholder.markdown if placeholder is not None else None
+
+def evaluate_with_model(model_name, answer, question, placeholder=None, on_update=None, use_cache=True):
+    """
+    Sends a prompt to the specified model to evaluate the candidate's answer.
+    If a placeholder (st.empty()) is given, the evaluation is streamed into it; worker
+    threads, which cannot write to Streamlit elements, pass an on_update callback instead.
+    Pass use_cache=False to force a fresh evaluation instead of a cached one.
+    """
+    prompt = EVALUATION_PROMPT.format(question=question, answer=answer)
     
     try:
-        response = requests.post(
-            "https://openrouter.ai/api/v1/chat/completions",
-            headers=headers,
-            data=json.dumps(payload),
-            timeout=10
-        )
-        response.raise_for_status()
-        result = response.json()
-        evaluation = result.get("choices", [{}])[0].get("message", {}).get("content", "No evaluation provided.")
+        evaluation = request_completion(
+            model_name, prompt, on_update or _stream_to(placeholder), use_cache=use_cache
+        ) or "No evaluation provided."
     except Exception as e:
         evaluation = f"Error during evaluation with {model_name}: {e}"
     
     return evaluation
 
-def evaluate_answer(answer, question, selected_model):
+def evaluate_answer(answer, question, selected_model, placeholder=None):
     """
     Evaluates the candidate's answer using the selected model(s).
+    Evaluations are streamed into the placeholder, if given; with both models,
+    each streams into its own column.
     """
     if selected_model == "Gemini":
         st.info("Calling Gemini model for evaluation...")
-        evaluation = evaluate_with_model(GEMINI_MODEL, answer, question)
+        evaluation = evaluate_with_model(GEMINI_MODEL, answer, question, placeholder)
         return f"**Evaluation from Gemini:**\n{evaluation}"
     elif selected_model == "Qwen":
         st.info("Calling Qwen model for evaluation...")
-        evaluation = evaluate_with_model(QWEN_MODEL, answer, question)
+        evaluation = evaluate_with_model(QWEN_MODEL, answer, question, placeholder)
         return f"**Evaluation from Qwen:**\n{evaluation}"
     else:
-        st.info("Calling Gemini model for evaluation...")
-        evaluation_gemini = evaluate_with_model(GEMINI_MODEL, answer, question)
-        st.info("Calling Qwen model for evaluation...")
-        evaluation_qwen = evaluate_with_model(QWEN_MODEL, answer, question)
-        combined_evaluation = (
-            f"**Evaluation from Gemini:**\n{evaluation_gemini}\n\n"
-            f"**Evaluation from Qwen:**\n{evaluation_qwen}"
+        st.info("Calling Gemini and Qwen models for evaluation...")
+        evaluation_gemini, evaluation_qwen = evaluate_side_by_side(
+            answer, question, placeholder if placeholder is not None else st.empty()
         )
-        return combined_evaluation
+        return combine_evaluations(evaluation_gemini, evaluation_qwen)
 
-def generate_clarification(answer, question):
+def evaluate_side_by_side(answer, question, placeholder):
+    """
+    Evaluates the answer with Gemini and Qwen concurrently, streaming each evaluation into
+    its own column of the placeholder. Returns (evaluation_gemini, evaluation_qwen).
+    """
+    models = (("Gemini", GEMINI_MODEL), ("Qwen", QWEN_MODEL))
+    column_placeholders = {}
+    for column, (label, model_name) in zip(placeholder.container().columns(2), models):
+        column.markdown(f"**Evaluation from {label}:**")
+        column_placeholders[model_name] = column.empty()
+
+    # Streamlit elements can only be written from the script thread, so the workers
+    # push streamed text onto a queue that is drained and rendered here.
+    updates = queue.Queue()
+
+    def drain_updates():
+        while True:
+            try:
+                model_name, text = updates.get_nowait()
+            except queue.Empty:
+                return
+            column_placeholders[model_name].markdown(text)
+
+    executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        futures = [
+            executor.submit(
+                evaluate_with_model, model_name, answer, question,
+                on_update=lambda text, model_name=model_name: updates.put((model_name, text))
+            )
+            for _, model_name in models
+        ]
+        while not all(future.done() for future in futures):
+            try:
+                model_name, text = updates.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            column_placeholders[model_name].markdown(text)
+            drain_updates()
+    finally:
+        # Don't wait here: if Streamlit stops this run mid-stream (the user touched a
+        # widget), the rerun must not block until both HTTP streams have finished.
+        executor.shutdown(wait=False, cancel_futures=True)
+    drain_updates()
+    return tuple(future.result() for future in futures)
+
+def combine_evaluations(evaluation_gemini, evaluation_qwen):
+    """
+    Formats the Gemini and Qwen evaluations of one answer as a single report entry.
+    """
+    return (
+        f"**Evaluation from Gemini:**\n{evaluation_gemini}\n\n"
+        f"**Evaluation from Qwen:**\n{evaluation_qwen}"
+    )
+
+def evaluate_interview(conversation_history):
+    """
+    Re-evaluates every round of a finished interview with both models, submitting all
+    (round, model) requests at once, and returns the combined evaluations in round order.
+    The response cache is bypassed so every evaluation is fetched fresh. A round is
+    returned as None if either model failed or returned nothing, so the caller can keep
+    that round's existing evaluation.
+    """
+    def fetch_evaluation(job):
+        model_name, answer, question = job
+        prompt = EVALUATION_PROMPT.format(question=question, answer=answer)
+        try:
+            return request_completion(model_name, prompt, use_cache=False)
+        except Exception:
+            return None
+
+    jobs = [
+        (model_name, entry["answer"], entry["question"])
+        for entry in conversation_history
+        for model_name in (GEMINI_MODEL, QWEN_MODEL)
+    ]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        evaluations = list(executor.map(fetch_evaluation, jobs))
+    return [
+        combine_evaluations(evaluation_gemini, evaluation_qwen) if evaluation_gemini and evaluation_qwen else None
+        for evaluation_gemini, evaluation_qwen in zip(evaluations[0::2], evaluations[1::2])
+    ]
+
+def generate_clarification(answer, question, placeholder=None, memo=None):
     """
     Uses the AI model to provide a detailed, correct answer along with clear explanations,
     as if practicing with a real interviewer. This response not only refines your answer
     but also shows you what a high-quality, detailed answer might look like.
+    If a placeholder (st.empty()) is given, the response is streamed into it.
+    If a memo dict is given, successful clarifications are stored in it keyed on the
+    (answer, question) pair and returned directly when the same pair is asked again.
     """
-    prompt = (
-        "You are a seasoned interviewer helping a candidate practice for a real interview. "
-        "The candidate has just provided an answer to the following interview question. "
-        "Please provide a detailed and correct answer that covers all key points, includes clear explanations, "
-        "and offers additional context that would be expected in a high-quality response. "
-        "In your response, highlight any areas where the candidate's answer might be lacking and show how it can be improved.\n\n"
-        f"Question: {question}\n\n"
-        f"Candidate's Answer: {answer}\n\n"
-        "Detailed Correct Answer and Explanation:"
-    )
+    memo_key = (hash(answer), hash(question))
+    if memo is not None and memo_key in memo:
+        return memo[memo_key]
+
+    prompt = CLARIFICATION_PROMPT.format(question=question, answer=answer)
     
-    payload = {
-        "model": GEMINI_MODEL,
-        "messages": [
-            {"role": "user", "content": [{"type": "text", "text": prompt}]}
-        ]
-    }
-    headers = {
-        "Authorization": f"Bearer {API_KEY}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": YOUR_SITE_URL,
-        "X-Title": YOUR_SITE_NAME
-    }
     try:
-        response = requests.post(
-            "https://openrouter.ai/api/v1/chat/completions",
-            headers=headers,
-            data=json.dumps(payload),
-            timeout=10
-        )
-        response.raise_for_status()
-        result = response.json()
-        clarification = result.get("choices", [{}])[0].get("message", {}).get("content", "No clarification provided.")
+        content = request_completion(GEMINI_MODEL, prompt, _stream_to(placeholder))
+        if content and memo is not None:
+            memo[memo_key] = content
+        clarification = content or "No clarification provided."
     except Exception as e:
         clarification = f"Error during clarification generation: {e}"
     return clarification
 
-def extract_text_from_pdf(pdf_file):
+@st.cache_data(show_spinner=False)
+def extract_text_from_pdf(_pdf_file, file_hash):
     """
-    Extracts text from the uploaded PDF file using PyPDF2.
+    Extracts text from the uploaded PDF file using pypdfium2 (PDFium), which reads
+    the file object directly instead of a copied bytes object.
+    Cached on file_hash (the file object itself is not hashed) so reruns with
+    the same upload skip the parse.
     """
-    pdf_reader = PyPDF2.PdfReader(pdf_file)
-    text = ""
-    for page in pdf_reader.pages:
-        page_text = page.extract_text()
-        if page_text:
-            text += page_text
-    return text
+    page_texts = []
+    with get_pdfium_lock():
+        pdf = pdfium.PdfDocument(_pdf_file)
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                page_text = textpage.get_text_range()
+                textpage.close()
+                page.close()
+                if page_text:
+                    page_texts.append(page_text)
+        finally:
+            pdf.close()
+    return "".join(page_texts)
 
-def generate_dynamic_question(resume_text, conversation_history):
+def build_question_system_prompt(resume_text):
+    """
+    Builds the question-generation system prompt for a resume. Called once per upload so
+    the (capped) resume prefix is identical for every round of the interview.
+    """
+    return QUESTION_SYSTEM_PROMPT.format(resume=resume_text[:MAX_RESUME_PROMPT_CHARS])
+
+def extend_history_synopsis(history_synopsis, conversation_history):
+    """
+    Returns history_synopsis updated for the newest round in conversation_history. Once more
+    than RECENT_HISTORY_ROUNDS rounds exist, the round that just left the verbatim window is
+    appended as a one-line synopsis of its question, so the synopsis grows by one line per
+    round instead of being rebuilt from the full history.
+    """
+    dropped = len(conversation_history) - RECENT_HISTORY_ROUNDS - 1
+    if dropped < 0:
+        return history_synopsis
+    synopsis = " ".join(conversation_history[dropped]['question'].split())[:HISTORY_SYNOPSIS_CHARS]
+    return history_synopsis + f"Q{dropped+1} (already asked): {synopsis}\n"
+
+def generate_dynamic_question(resume_prompt, conversation_history, placeholder=None, history_synopsis=""):
     """
     Generates a dynamic interview question based on the candidate's resume and conversation history.
+    resume_prompt is the system prompt from build_question_system_prompt, and history_synopsis
+    covers the rounds before the last RECENT_HISTORY_ROUNDS (see extend_history_synopsis).
+    If a placeholder (st.empty()) is given, the question is streamed into it.
     """
-    history_text = ""
-    if conversation_history:
-        for i, entry in enumerate(conversation_history):
-            history_text += f"Q{i+1}: {entry['question']}\nA{i+1}: {entry['answer']}\n"
-    else:
+    # Keep the prompt size roughly constant across rounds: older rounds come from the
+    # running synopsis and only the most recent rounds are included verbatim.
+    recent_start = max(len(conversation_history) - RECENT_HISTORY_ROUNDS, 0)
+    history_text = history_synopsis + "".join(
+        f"Q{i+1}: {entry['question']}\nA{i+1}: {entry['answer']}\n"
+        for i, entry in enumerate(conversation_history[recent_start:], start=recent_start)
+    )
+    if not history_text:
         history_text = "No previous conversation."
     
-    prompt = (
-        "You are an interviewer. Given the candidate's resume and the conversation so far, "
-        "please generate a dynamic, context-specific interview question that probes the candidate's hands-on skills "
-        "and understanding of key concepts mentioned in the resume. Avoid generic questions and ensure the question "
-        "is relevant to the candidate's background.\n\n"
-        f"Candidate's Resume:\n{resume_text}\n\n"
-        f"Conversation History:\n{history_text}\n\n"
-        "Interview Question:"
-    )
+    # The instructions and resume stay byte-identical for the whole interview, so they go
+    # first as the system message where provider-side prompt caching can reuse them;
+    # only the history-dependent part changes between rounds.
+    prompt = QUESTION_PROMPT.format(history=history_text)
     
-    payload = {
-        "model": GEMINI_MODEL,
-        "messages": [
-            {"role": "user", "content": [{"type": "text", "text": prompt}]}
-        ]
-    }
-    headers = {
-        "Authorization": f"Bearer {API_KEY}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": YOUR_SITE_URL,
-        "X-Title": YOUR_SITE_NAME
-    }
     try:
-        response = requests.post(
-            "https://openrouter.ai/api/v1/chat/completions",
-            headers=headers,
-            data=json.dumps(payload),
-            timeout=10
-        )
-        response.raise_for_status()
-        result = response.json()
-        question = result.get("choices", [{}])[0].get("message", {}).get("content", "No question generated.")
+        question = request_completion(
+            GEMINI_MODEL, prompt, _stream_to(placeholder), system_prompt=resume_prompt
+        ) or "No question generated."
     except Exception as e:
         question = f"Error generating question: {e}"
     return question
@@ -221,6 +483,8 @@ def main():
         st.session_state.current_question = ""
     if "resume_text" not in st.session_state:
         st.session_state.resume_text = ""
+    if "resume_prompt" not in st.session_state:
+        st.session_state.resume_prompt = ""
     if "selected_model" not in st.session_state:
         st.session_state.selected_model = "Both"
     if "round" not in st.session_state:
@@ -233,6 +497,10 @@ def main():
         st.session_state.current_evaluation = ""
     if "current_clarification" not in st.session_state:
         st.session_state.current_clarification = ""
+    if "clarification_cache" not in st.session_state:
+        st.session_state.clarification_cache = {}
+    if "history_synopsis" not in st.session_state:
+        st.session_state.history_synopsis = ""
 
     # Sidebar: Model selection.
     st.sidebar.header("Model Selection")
@@ -245,8 +513,12 @@ def main():
     st.sidebar.header("Upload Your Resume PDF")
     uploaded_file = st.sidebar.file_uploader("Choose a PDF file", type="pdf", key="resume_uploader")
     if uploaded_file is not None:
-        resume_text = extract_text_from_pdf(uploaded_file)
-        st.session_state.resume_text = resume_text
+        file_hash = hashlib.file_digest(uploaded_file, "sha256").hexdigest()
+        uploaded_file.seek(0)
+        resume_text = extract_text_from_pdf(uploaded_file, file_hash)
+        if resume_text != st.session_state.resume_text:
+            st.session_state.resume_text = resume_text
+            st.session_state.resume_prompt = build_question_system_prompt(resume_text)
         st.sidebar.success("Resume uploaded and processed!")
     
     if st.session_state.resume_text == "":
@@ -258,6 +530,20 @@ def main():
     if st.session_state.round >= MAX_ROUNDS:
         st.header("Interview Completed")
         st.write("Thank you for participating in the interview. Below is your performance report:")
+        if st.button("Regenerate report with both models", key="regenerate_report"):
+            with st.spinner("Re-evaluating all rounds with Gemini and Qwen..."):
+                evaluations = evaluate_interview(st.session_state.conversation_history)
+            failed_rounds = []
+            for i, (entry, evaluation) in enumerate(zip(st.session_state.conversation_history, evaluations)):
+                if evaluation is None:
+                    failed_rounds.append(str(i + 1))
+                else:
+                    entry["evaluation"] = evaluation
+            if failed_rounds:
+                st.warning(
+                    f"Could not re-evaluate round(s) {', '.join(failed_rounds)}; "
+                    "their previous evaluations have been kept. Please try again later."
+                )
         report = ""
         for i, entry in enumerate(st.session_state.conversation_history):
             report += f"### Round {i+1}\n"
@@ -270,14 +556,16 @@ def main():
         st.markdown(report)
         return
 
-    # Generate a new question if not already set.
+    st.header(f"Interview Round {st.session_state.round + 1}")
+    question_placeholder = st.empty()
+
+    # Generate a new question if not already set, streaming it in as it arrives.
     if st.session_state.current_question == "":
         st.session_state.current_question = generate_dynamic_question(
-            st.session_state.resume_text, st.session_state.conversation_history
+            st.session_state.resume_prompt, st.session_state.conversation_history, question_placeholder,
+            history_synopsis=st.session_state.history_synopsis
         )
-    
-    st.header(f"Interview Round {st.session_state.round + 1}")
-    st.write(st.session_state.current_question)
+    question_placeholder.write(st.session_state.current_question)
     
     candidate_answer = st.text_area("Your Answer:", key=f"answer_{st.session_state.round}")
     
@@ -286,21 +574,46 @@ def main():
         if candidate_answer.strip() == "":
             st.warning("Please enter your answer before submitting.")
         else:
+            # Start generating the next question while this answer is evaluated and reviewed.
+            # The prefetch is keyed on the answer it was built from: if an interrupted run
+            # brings the Submit button back and the answer is edited, prefetch again.
+            prefetched = st.session_state.get("prefetched_question")
+            if st.session_state.round + 1 < MAX_ROUNDS and (prefetched is None or prefetched[0] != candidate_answer):
+                if prefetched is not None:
+                    prefetched[1].cancel()
+                pending_history = st.session_state.conversation_history + [{
+                    "question": st.session_state.current_question,
+                    "answer": candidate_answer
+                }]
+                st.session_state.prefetched_question = (candidate_answer, get_background_executor().submit(
+                    generate_dynamic_question, st.session_state.resume_prompt, pending_history,
+                    history_synopsis=extend_history_synopsis(st.session_state.history_synopsis, pending_history)
+                ))
             st.info("Evaluating your answer... Please wait.")
-            evaluation = evaluate_answer(candidate_answer, st.session_state.current_question, st.session_state.selected_model)
+            evaluation_placeholder = st.empty()
+            evaluation = evaluate_answer(
+                candidate_answer, st.session_state.current_question, st.session_state.selected_model,
+                evaluation_placeholder
+            )
             st.session_state.current_evaluation = evaluation
             st.session_state.current_answer = candidate_answer
             st.session_state.awaiting_confirmation = True
-            st.success("Evaluation completed!")
-            st.markdown(evaluation)
+            # Replace the streamed text with the final, labelled evaluation.
+            with evaluation_placeholder.container():
+                st.success("Evaluation completed!")
+                st.markdown(evaluation)
     
     # If awaiting confirmation.
     if st.session_state.awaiting_confirmation:
         if st.button("Need More Clarification", key=f"clarify_{st.session_state.round}"):
-            clarification = generate_clarification(st.session_state.current_answer, st.session_state.current_question)
-            st.session_state.current_clarification = clarification
             st.info("Clarification / Detailed Answer:")
-            st.markdown(clarification)
+            clarification_placeholder = st.empty()
+            clarification = generate_clarification(
+                st.session_state.current_answer, st.session_state.current_question, clarification_placeholder,
+                memo=st.session_state.clarification_cache
+            )
+            st.session_state.current_clarification = clarification
+            clarification_placeholder.markdown(clarification)
         if st.button("Proceed to Next Question", key=f"next_{st.session_state.round}"):
             st.session_state.conversation_history.append({
                 "question": st.session_state.current_question,
@@ -308,9 +621,17 @@ def main():
                 "evaluation": st.session_state.current_evaluation,
                 "clarification": st.session_state.current_clarification
             })
+            st.session_state.history_synopsis = extend_history_synopsis(
+                st.session_state.history_synopsis, st.session_state.conversation_history
+            )
             st.session_state.round += 1
             st.session_state.awaiting_confirmation = False
-            st.session_state.current_question = ""
+            prefetched = st.session_state.pop("prefetched_question", None)
+            if prefetched is not None and prefetched[0] == st.session_state.current_answer:
+                with st.spinner("Preparing the next question..."):
+                    st.session_state.current_question = prefetched[1].result()
+            else:
+                st.session_state.current_question = ""
             st.session_state.current_answer = ""
             st.session_state.current_evaluation = ""
             st.session_state.current_clarification = ""